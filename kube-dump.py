@@ -1,25 +1,69 @@
 #!/usr/bin/env python3
-import bz2
-import gzip
+import hashlib
+import json
 import logging
-import lzma
+import multiprocessing
 import os
+import queue
 import shutil
+import ssl
+import subprocess
 import sys
 import tarfile
+import threading
 import time
 import traceback
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
 
 import click
+import httpx
+import pygit2
 import requests
 import yaml
-from git import Repo
-from git.exc import InvalidGitRepositoryError
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
+from requests.utils import should_bypass_proxies
+
+# Optional faster JSON parser for API responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional fast non-cryptographic hash for the manifest cache
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Optional in-process compressors for zst/lz4 archives
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+# Prefer the LibYAML-backed emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
 
 
 # === Logging (match original style) ===
@@ -56,17 +100,200 @@ def setup_logger(silent: bool = False, with_timestamp: bool = False):
 
 logger = logging.getLogger("kube-dump")
 
+# Number of concurrent list requests sent to the API server
+API_WORKERS = 32
+
+# Seconds a cached API discovery result is reused
+DISCOVERY_CACHE_TTL = 300
+
+# Items requested per page when listing resources
+LIST_PAGE_SIZE = 500
+
+# Fetched pages waiting for the main thread; fetch threads block when it is full
+PAGE_QUEUE_SIZE = 8
+
+# Seconds a blocked fetch thread waits before re-checking for cancellation
+PAGE_QUEUE_POLL = 0.5
+
+# HTTP/2 connections to the API server; requests are multiplexed over them
+HTTP_MAX_CONNECTIONS = 64
+
+# Seconds before an API request times out
+HTTP_TIMEOUT = 60.0
+
 
 # === Raw API call ===
-def call_k8s_api(path: str) -> Dict[str, Any]:
-    api_client = client.ApiClient()
-    return api_client.call_api(
-        path,
-        "GET",
-        auth_settings=["BearerToken"],
-        response_type="object",
-        _return_http_data_only=True,
-    )
+class KubeHttpClient:
+    """HTTP/2 GET client for the API server, configured from the loaded kubeconfig."""
+
+    def __init__(self, configuration: client.Configuration):
+        self.configuration = configuration
+        ssl_context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+        if configuration.cert_file:
+            ssl_context.load_cert_chain(configuration.cert_file, configuration.key_file)
+        if not configuration.verify_ssl:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        # Like kubernetes.client.rest: only the kubeconfig proxy is used, never
+        # HTTP(S)_PROXY from the environment, and no_proxy hosts bypass it
+        proxy = configuration.proxy
+        if proxy and should_bypass_proxies(
+            configuration.host, no_proxy=configuration.no_proxy or ""
+        ):
+            proxy = None
+        self.http = httpx.Client(
+            base_url=configuration.host,
+            verify=ssl_context,
+            proxy=proxy or None,
+            trust_env=False,
+            http2=True,
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS),
+            timeout=HTTP_TIMEOUT,
+        )
+        # kubeconfig tls-server-name: SNI and certificate check use this name
+        # instead of the host from the server URL
+        self.extensions = {}
+        if configuration.tls_server_name:
+            self.extensions["sni_hostname"] = configuration.tls_server_name
+
+    def get(
+        self, path: str, query_params: Optional[List[Tuple[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        # auth_settings() also refreshes expiring tokens (exec plugins, in-cluster)
+        headers = {}
+        bearer = self.configuration.auth_settings().get("BearerToken")
+        if bearer:
+            headers[bearer["key"]] = bearer["value"]
+        resp = self.http.get(
+            path, params=query_params, headers=headers, extensions=self.extensions
+        )
+        if not resp.is_success:
+            raise ApiException(status=resp.status_code, reason=resp.reason_phrase)
+        if orjson is not None:
+            return orjson.loads(resp.content)
+        return json.loads(resp.content)
+
+
+# Shared client, created on first use so it picks up the loaded kubeconfig
+_API_CLIENT: Optional[KubeHttpClient] = None
+_API_CLIENT_LOCK = threading.Lock()
+
+
+def get_api_client() -> KubeHttpClient:
+    global _API_CLIENT
+    if _API_CLIENT is None:
+        with _API_CLIENT_LOCK:
+            if _API_CLIENT is None:
+                _API_CLIENT = KubeHttpClient(client.Configuration.get_default_copy())
+    return _API_CLIENT
+
+
+def call_k8s_api(
+    path: str, query_params: Optional[List[Tuple[str, Any]]] = None
+) -> Dict[str, Any]:
+    return get_api_client().get(path, query_params=query_params)
+
+
+# Yields list pages (lists of items) using the limit/continue API
+def list_pages(
+    path: str, limit: int = LIST_PAGE_SIZE
+) -> Iterator[List[Dict[str, Any]]]:
+    continue_token = None
+    while True:
+        query_params = [("limit", limit)]
+        if continue_token:
+            query_params.append(("continue", continue_token))
+        data = call_k8s_api(path, query_params=query_params)
+        yield data.get("items", [])
+        continue_token = data.get("metadata", {}).get("continue")
+        if not continue_token:
+            break
+
+
+def list_paged(path: str, limit: int = LIST_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+    for page in list_pages(path, limit):
+        yield from page
+
+
+# Yields pages of a namespaced resource for ns_list from one cluster-wide
+# list; a single namespace, or a forbidden cluster-wide list (namespace-scoped
+# RBAC), falls back to listing each namespace. Namespaces that fail to list
+# are recorded in failed so one failing namespace does not discard the others.
+def list_namespaced(
+    list_path: str, ns_tmpl: str, ns_list: List[str], failed: Dict[str, Exception]
+) -> Iterator[List[Dict[str, Any]]]:
+    if len(ns_list) > 1:
+        pages = list_pages(list_path)
+        try:
+            first = next(pages)
+        except ApiException as e:
+            if e.status != 403:
+                raise
+        else:
+            yield first
+            yield from pages
+            return
+    for ns in ns_list:
+        try:
+            yield from list_pages(ns_tmpl.format(ns=ns))
+        except Exception as e:
+            failed[ns] = e
+
+
+# Runs each (key, pages) job on the API threads and yields (key, page, None)
+# per page as it arrives, then (key, None, error) once the job is done. The
+# bounded queue stops fetching from outrunning the consumer, so at most
+# API_WORKERS + PAGE_QUEUE_SIZE pages are held at once.
+def stream_pages(
+    jobs: List[Tuple[Any, Iterable[List[Dict[str, Any]]]]],
+) -> Iterator[Tuple[Any, Optional[List[Dict[str, Any]]], Optional[Exception]]]:
+    results: queue.Queue = queue.Queue(maxsize=PAGE_QUEUE_SIZE)
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                results.put(entry, timeout=PAGE_QUEUE_POLL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(key, pages):
+        error = None
+        try:
+            for page in pages:
+                if not put((key, page, None)):
+                    return
+        except Exception as e:
+            error = e
+        put((key, None, error))
+
+    executor = ThreadPoolExecutor(max_workers=API_WORKERS)
+    try:
+        for key, pages in jobs:
+            executor.submit(run, key, pages)
+        remaining = len(jobs)
+        while remaining:
+            key, page, error = results.get()
+            if page is None:
+                remaining -= 1
+            yield key, page, error
+    finally:
+        # Unblock fetch threads if the consumer stopped early
+        stop.set()
+        executor.shutdown(cancel_futures=True)
+
+
+# Logs a namespace that failed in list_namespaced: 403 warns, 404 is skipped
+def log_namespace_error(res_name: str, ns: str, err: Exception):
+    if isinstance(err, ApiException):
+        if err.status == 403:
+            logger.warning(f"Access denied to {res_name} in namespace={ns}")
+        elif err.status != 404:
+            logger.debug(f"API error for {res_name} in namespace={ns}: {err}")
+    else:
+        logger.debug(f"Failed to dump {res_name} in {ns}: {err}")
 
 
 # === Clean resource (keep apiVersion/kind!) ===
@@ -82,47 +309,240 @@ def clean_resource(obj: Dict[str, Any], detailed: bool = False) -> Dict[str, Any
             "creationTimestamp",
         ]:
             meta.pop(key, None)
-        obj["metadata"] = meta
     return obj
 
 
 # === Save object ===
+def write_file(path: Path, data: bytes):
+    """Write data with raw os calls, skipping the buffered/text IO layers."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+# Hashes of previously written manifests, kept in the destination directory
+MANIFEST_CACHE_FILE = ".kube-dump-cache.json"
+
+
+def content_hash(data: bytes) -> str:
+    if xxhash is not None:
+        return xxhash.xxh3_64(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+class ManifestCache:
+    """Tracks written manifests so unchanged ones are not rewritten."""
+
+    def __init__(self, base_dir: Path):
+        self.path = base_dir / MANIFEST_CACHE_FILE
+        self.previous: Dict[str, List[Any]] = {}
+        self.current: Dict[str, List[Any]] = {}
+        try:
+            with self.path.open() as f:
+                self.previous = json.load(f)
+        except Exception as e:
+            logger.debug(f"No usable manifest cache: {e}")
+
+    def record(self, key: str, entry: List[Any]):
+        self.current[key] = entry
+
+    def save(self):
+        # Only manifests seen in this run are kept
+        try:
+            with self.path.open("w") as f:
+                json.dump(self.current, f)
+        except Exception as e:
+            logger.debug(f"Failed to write manifest cache: {e}")
+
+
+# Top-level directories holding dumped manifests
+MANIFEST_DIRS = ("namespaces", "cluster")
+
+
+def prune_manifests(base_dir: Path, keep: Dict[str, Any]) -> int:
+    """Delete manifests whose key is not in keep, and directories left empty."""
+    removed = 0
+    for top in MANIFEST_DIRS:
+        for dir_path, _, filenames in os.walk(base_dir / top, topdown=False):
+            for filename in filenames:
+                file_path = Path(dir_path) / filename
+                if file_path.relative_to(base_dir).as_posix() not in keep:
+                    file_path.unlink()
+                    removed += 1
+            if not os.listdir(dir_path):
+                os.rmdir(dir_path)
+    return removed
+
+
+# Previous run's manifest cache entries, set in each save worker process
+_PREVIOUS_MANIFESTS: Dict[str, List[Any]] = {}
+
+
+def init_save_worker(previous: Dict[str, List[Any]]):
+    global _PREVIOUS_MANIFESTS
+    _PREVIOUS_MANIFESTS = previous
+
+
+def _is_unchanged(path: Path, entry: Optional[List[Any]], digest: str) -> bool:
+    """True if path still holds exactly what was written with this digest."""
+    if not entry or entry[0] != digest:
+        return False
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    return [st.st_mtime_ns, st.st_size] == entry[1:]
+
+
+# Objects with more payload than this (in data/binaryData) are saved as JSON,
+# which skips YAML's per-character escape scanning of large base64 blobs
+JSON_DATA_THRESHOLD = 4096
+
+
+def _data_size(obj: Dict[str, Any]) -> int:
+    size = 0
+    for field in ("data", "binaryData"):
+        values = obj.get(field)
+        if isinstance(values, dict):
+            size += sum(len(v) for v in values.values() if isinstance(v, str))
+    return size
+
+
+# Runs in a worker process; returns the manifest cache (key, entry) pair
 def save_object(
     obj: Dict[str, Any],
-    base_dir: Path,
+    base_dir: str,
     resource_name: str,
     namespace: Optional[str] = None,
-):
+) -> Optional[Tuple[str, List[Any]]]:
     name = obj.get("metadata", {}).get("name")
     if not name:
-        return
+        return None
+    use_json = obj.get("kind") == "Secret" or _data_size(obj) > JSON_DATA_THRESHOLD
+    filename = f"{name}.json" if use_json else f"{name}.yaml"
     if namespace:
-        path = base_dir / "namespaces" / namespace / resource_name / f"{name}.yaml"
+        key = f"namespaces/{namespace}/{resource_name}/{filename}"
     else:
-        path = base_dir / "cluster" / resource_name / f"{name}.yaml"
+        key = f"cluster/{resource_name}/{filename}"
+    path = Path(base_dir) / key
     path.parent.mkdir(parents=True, exist_ok=True)
+    # Remove the copy in the other format so only one manifest per object
+    # remains; its cache entry lapses because this run never records it
+    path.with_suffix(".yaml" if use_json else ".json").unlink(missing_ok=True)
+
+    if use_json:
+        ordered = {"apiVersion": obj["apiVersion"], "kind": obj["kind"], **obj}
+        if orjson is not None:
+            data = orjson.dumps(
+                ordered, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            )
+        else:
+            data = (json.dumps(ordered, indent=2) + "\n").encode("utf-8")
+    else:
+        # apiVersion and kind go first (standard k8s manifest order); the rest
+        # keeps the order the API server returned it in
+        header = f"apiVersion: {obj['apiVersion']}\nkind: {obj['kind']}\n"
+        body = yaml.dump(
+            {k: v for k, v in obj.items() if k not in ("apiVersion", "kind")},
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+        data = (header + body).encode("utf-8")
+    digest = content_hash(data)
+    entry = _PREVIOUS_MANIFESTS.get(key)
+    if not _is_unchanged(path, entry, digest):
+        write_file(path, data)
+        st = path.stat()
+        entry = [digest, st.st_mtime_ns, st.st_size]
+    return key, entry
+
+
+# Saves queued per save worker before the producer waits for one to finish
+SAVE_QUEUE_PER_WORKER = 64
+
+
+class ManifestWriter:
+    """Runs save_object in-process, or in a bounded pool of worker processes."""
+
+    def __init__(self, base_dir: Path, cache: ManifestCache, workers: int = 0):
+        self.base_dir = str(base_dir)
+        self.cache = cache
+        self.pending: Dict[Future, str] = {}
+        self.max_pending = workers * SAVE_QUEUE_PER_WORKER
+        self.pool: Optional[ProcessPoolExecutor] = None
+        if workers > 0:
+            # spawn, as forking while the fetch threads hold locks is unsafe
+            self.pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_save_worker,
+                initargs=(cache.previous,),
+            )
+        else:
+            init_save_worker(cache.previous)
 
-    # Reorder keys to have apiVersion and kind first (standard k8s manifest order)
-    ordered = {}
-    for key in ["apiVersion", "kind", "metadata", "spec", "data", "stringData", "type"]:
-        if key in obj:
-            ordered[key] = obj[key]
-    # Add remaining keys
-    for key, value in obj.items():
-        if key not in ordered:
-            ordered[key] = value
+    def submit(self, obj: Dict[str, Any], resource_name: str, namespace: Optional[str]):
+        if self.pool is None:
+            try:
+                result = save_object(obj, self.base_dir, resource_name, namespace)
+            except Exception as e:
+                logger.debug(f"Failed to save {resource_name}: {e}")
+                return
+            if result:
+                self.cache.record(*result)
+            return
+
+        if len(self.pending) >= self.max_pending:
+            done, _ = wait(self.pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._collect(future)
+        future = self.pool.submit(
+            save_object, obj, self.base_dir, resource_name, namespace
+        )
+        self.pending[future] = resource_name
 
-    with path.open("w") as f:
-        yaml.dump(ordered, f, default_flow_style=False, sort_keys=False)
+    def _collect(self, future: Future):
+        resource_name = self.pending.pop(future)
+        try:
+            result = future.result()
+        except BrokenProcessPool:
+            raise
+        except Exception as e:
+            logger.debug(f"Failed to save {resource_name}: {e}")
+            return
+        if result:
+            self.cache.record(*result)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.pool is None:
+            return
+        if exc_type is not None:
+            self.pool.shutdown(cancel_futures=True)
+            return
+        for future in as_completed(list(self.pending)):
+            self._collect(future)
+        self.pool.shutdown()
 
 
 # === Discover all readable API resources ===
-# Returns tuples of (group, version, res_name, namespaced, kind)
-def discover_resources() -> (
-    Tuple[List[Tuple[str, str, str, bool, str]], List[Tuple[str, str, str, bool, str]]]
-):
+# Returns tuples of (group, version, res_name, namespaced, kind) and whether
+# every API group was discovered (False when any request failed)
+def discover_resources() -> Tuple[
+    List[Tuple[str, str, str, bool, str]],
+    List[Tuple[str, str, str, bool, str]],
+    bool,
+]:
     ns_list = []
     cluster_list = []
+    complete = True
 
     # Core v1
     try:
@@ -139,6 +559,7 @@ def discover_resources() -> (
                 (ns_list if item[3] else cluster_list).append(item)
     except Exception as e:
         logger.debug(f"Failed to discover core v1: {e}")
+        complete = False
 
     # Other API groups
     try:
@@ -166,13 +587,140 @@ def discover_resources() -> (
                         (ns_list if item[3] else cluster_list).append(item)
             except Exception as e:
                 logger.debug(f"Skip {group_name}/{version}: {e}")
+                complete = False
     except Exception as e:
         logger.debug(f"Failed to list API groups: {e}")
+        complete = False
+
+    return ns_list, cluster_list, complete
+
+
+def _discovery_cache_path() -> Path:
+    host = client.Configuration.get_default_copy().host
+    host_hash = hashlib.sha256(host.encode("utf-8")).hexdigest()[:16]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "kube-dump" / f"disco-{host_hash}.json"
+
 
+def discover_resources_cached(
+    ttl: int = DISCOVERY_CACHE_TTL,
+) -> Tuple[
+    List[Tuple[str, str, str, bool, str]], List[Tuple[str, str, str, bool, str]]
+]:
+    """Return (namespaced, cluster) resources, reusing a per-cluster disk cache."""
+    cache_path = _discovery_cache_path()
+    try:
+        if time.time() - cache_path.stat().st_mtime < ttl:
+            with cache_path.open() as f:
+                cached = json.load(f)
+            logger.debug(f"Using cached API discovery from {cache_path}")
+            return (
+                [tuple(item) for item in cached["namespaced"]],
+                [tuple(item) for item in cached["cluster"]],
+            )
+    except Exception as e:
+        logger.debug(f"No usable discovery cache: {e}")
+
+    ns_list, cluster_list, complete = discover_resources()
+    # Partial results are used for this run but never cached
+    if complete:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with cache_path.open("w") as f:
+                json.dump({"namespaced": ns_list, "cluster": cluster_list}, f)
+        except Exception as e:
+            logger.debug(f"Failed to write discovery cache: {e}")
     return ns_list, cluster_list
 
 
+# Returns (api_version, list_path, namespaced_path_template)
+def resource_paths(group: str, version: str, res_name: str) -> Tuple[str, str, str]:
+    if group == "":
+        prefix = f"/api/{version}"
+        api_version = version
+    else:
+        prefix = f"/apis/{group}/{version}"
+        api_version = f"{group}/{version}"
+    return api_version, f"{prefix}/{res_name}", f"{prefix}/namespaces/{{ns}}/{res_name}"
+
+
+# === Archive ===
+# Multi-threaded compressors used instead of tarfile's built-in ones when installed
+PARALLEL_COMPRESSORS = {
+    "gz": ["pigz", "-c"],
+    "bz2": ["pbzip2", "-c"],
+    "xz": ["pixz"],
+    "zst": ["zstd", "-T0", "-c"],
+    "lz4": ["lz4", "-c"],
+}
+# Archive types tarfile can compress by itself
+TARFILE_COMPRESSIONS = ("gz", "bz2", "xz")
+
+
+class ArchiveError(Exception):
+    """Raised when archive creation fails"""
+
+    pass
+
+
+def _skip_archive_files(tarinfo: tarfile.TarInfo) -> Optional[tarfile.TarInfo]:
+    # Only top-level entries ("./<name>") can be archives or the manifest cache
+    parts = tarinfo.name.split("/")
+    if len(parts) == 2:
+        name = parts[1]
+        if name.startswith("backup-") and ".tar" in name:
+            return None
+        if name == MANIFEST_CACHE_FILE:
+            return None
+    return tarinfo
+
+
+def _add_backup_items(tar: tarfile.TarFile, dest: Path):
+    tar.add(str(dest), arcname=".", recursive=True, filter=_skip_archive_files)
+
+
+def _open_compressed_stream(out, archive_type: str):
+    if archive_type == "zst":
+        if zstandard is None:
+            raise ArchiveError("zst archives need the zstd binary or zstandard package")
+        return zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(out)
+    if archive_type == "lz4":
+        if lz4 is None:
+            raise ArchiveError("lz4 archives need the lz4 binary or lz4 package")
+        return lz4.frame.open(out, "wb")
+    raise ArchiveError(f"Unsupported archive type: {archive_type}")
+
+
+def write_archive(dest: Path, archive_path: Path, archive_type: str):
+    """Tar the backup into archive_path, using a parallel compressor if installed."""
+    compressor = PARALLEL_COMPRESSORS.get(archive_type)
+    if compressor and shutil.which(compressor[0]):
+        with archive_path.open("wb") as out:
+            proc = subprocess.Popen(compressor, stdin=subprocess.PIPE, stdout=out)
+            try:
+                with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                    _add_backup_items(tar, dest)
+            finally:
+                proc.stdin.close()
+                returncode = proc.wait()
+        if returncode != 0:
+            raise ArchiveError(f"{compressor[0]} exited with status {returncode}")
+    elif archive_type in TARFILE_COMPRESSIONS:
+        # tarfile compresses while streaming; archive types match its modes
+        with tarfile.open(archive_path, f"w:{archive_type}") as tar:
+            _add_backup_items(tar, dest)
+    else:
+        with archive_path.open("wb") as out:
+            with _open_compressed_stream(out, archive_type) as stream:
+                with tarfile.open(fileobj=stream, mode="w|") as tar:
+                    _add_backup_items(tar, dest)
+
+
 # === Slack notification ===
+# Shared session so repeated notifications reuse the TLS connection
+_SLACK_SESSION = requests.Session()
+
+
 def send_slack_notification(
     slack_url: str,
     channel: str,
@@ -212,7 +760,7 @@ def send_slack_notification(
     }
 
     try:
-        resp = requests.post(slack_url, json=payload, timeout=10)
+        resp = _SLACK_SESSION.post(slack_url, json=payload, timeout=10)
         if resp.status_code != 200:
             logger.warning(f"Slack notification failed: {resp.status_code} {resp.text}")
         else:
@@ -230,12 +778,82 @@ class GitError(Exception):
     pass
 
 
+# Number of old backup folders removed concurrently
+RMTREE_WORKERS = 8
+
+# Remote-tracking namespace used for the fetched branch
+FETCH_REF_PREFIX = "refs/remotes/kube-dump"
+
+# Private keys in ~/.ssh tried for SSH remotes after the ssh-agent
+SSH_KEY_FILES = ("id_ed25519", "id_ecdsa", "id_rsa")
+
+
+def _remove_tree(dir_path: str) -> str:
+    shutil.rmtree(dir_path)
+    return dir_path
+
+
+class GitCallbacks(pygit2.RemoteCallbacks):
+    """Authenticate fetch/push and collect rejected refs."""
+
+    def __init__(self, remote_url: str):
+        super().__init__()
+        parts = urlsplit(remote_url)
+        self.username = unquote(parts.username) if parts.username else None
+        self.password = unquote(parts.password) if parts.password else None
+        self.password_sent = False
+        self.username_sent = False
+        self.ssh_keys: Optional[Iterator[pygit2.Keypair]] = None
+        self.rejected: List[str] = []
+
+    @staticmethod
+    def _ssh_keys(username: str) -> Iterator[pygit2.Keypair]:
+        if os.environ.get("SSH_AUTH_SOCK"):
+            yield pygit2.KeypairFromAgent(username)
+        ssh_dir = Path.home() / ".ssh"
+        for name in SSH_KEY_FILES:
+            private_key = ssh_dir / name
+            if private_key.is_file():
+                public_key = ssh_dir / f"{name}.pub"
+                yield pygit2.Keypair(
+                    username,
+                    str(public_key) if public_key.is_file() else None,
+                    str(private_key),
+                    "",
+                )
+
+    # libgit2 calls this again after each rejected credential, so every
+    # method is offered once and a GitError ends the retries
+    def credentials(self, url, username_from_url, allowed_types):
+        host = urlsplit(url).hostname or "remote"
+        username = username_from_url or self.username or "git"
+        if allowed_types & pygit2.enums.CredentialType.USERPASS_PLAINTEXT:
+            if self.password is not None and not self.password_sent:
+                self.password_sent = True
+                return pygit2.UserPass(username, self.password)
+        if allowed_types & pygit2.enums.CredentialType.SSH_KEY:
+            if self.ssh_keys is None:
+                self.ssh_keys = self._ssh_keys(username)
+            key = next(self.ssh_keys, None)
+            if key is not None:
+                return key
+        if allowed_types & pygit2.enums.CredentialType.USERNAME:
+            if not self.username_sent:
+                self.username_sent = True
+                return pygit2.Username(username)
+        raise GitError(f"Authentication to {host} failed")
+
+    def push_update_reference(self, refname, message):
+        if message is not None:
+            self.rejected.append(f"{refname}: {message}")
+
+
 def git_init_and_pull(
     repo_path: Path,
     branch: str,
     remote_url: Optional[str],
 ):
-    """Initialize/clone repo and pull latest changes, then clean old backup folders."""
+    """Initialize/clone repo and pull latest changes, then clean old folders."""
     if not remote_url:
         return None
 
@@ -243,69 +861,126 @@ def git_init_and_pull(
     repo_path.mkdir(parents=True, exist_ok=True)
 
     if git_dir.exists():
-        repo = Repo(repo_path)
+        repo = pygit2.Repository(str(repo_path))
         logger.info(f"Using existing git repo in {repo_path}")
     else:
-        repo = Repo.init(repo_path)
+        repo = pygit2.init_repository(str(repo_path))
         logger.info(f"Initialized new git repo in {repo_path}")
 
+    # Keep the local manifest cache out of commits
+    exclude_file = git_dir / "info" / "exclude"
+    exclude_file.parent.mkdir(parents=True, exist_ok=True)
+    excludes = exclude_file.read_text().splitlines() if exclude_file.exists() else []
+    if MANIFEST_CACHE_FILE not in excludes:
+        exclude_file.write_text("\n".join(excludes + [MANIFEST_CACHE_FILE]) + "\n")
+
+    branch_ref = f"refs/heads/{branch}"
+    fetch_ref = f"{FETCH_REF_PREFIX}/{branch}"
+
     # Try to pull from remote
     try:
-        repo.git.fetch(remote_url, branch)
-        # Check if branch exists locally
-        if branch not in [ref.name for ref in repo.branches]:
-            # Create branch tracking remote
-            repo.git.checkout("-b", branch, f"FETCH_HEAD")
-        else:
-            repo.git.checkout(branch)
-            repo.git.reset("--hard", "FETCH_HEAD")
+        remote = repo.remotes.create_anonymous(remote_url)
+        remote.fetch(
+            [f"+{branch_ref}:{fetch_ref}"],
+            callbacks=GitCallbacks(remote_url),
+            proxy=True,
+        )
+        target = repo.references[fetch_ref].target
+        # Create or move the local branch to the fetched commit
+        repo.references.create(branch_ref, target, force=True)
+        repo.set_head(branch_ref)
+        repo.reset(target, pygit2.enums.ResetMode.HARD)
         logger.info(f"Pulled latest from remote (branch: {branch})")
-    except Exception as e:
+    except (pygit2.GitError, GitError, KeyError) as e:
         logger.debug(f"Could not pull from remote (may be empty repo): {e}")
         # Just checkout/create the branch
-        if branch not in [ref.name for ref in repo.branches]:
-            repo.git.checkout("-b", branch)
+        if branch_ref in repo.references:
+            repo.checkout(branch_ref)
+        elif repo.head_is_unborn:
+            repo.set_head(branch_ref)
         else:
-            repo.git.checkout(branch)
-
-    # Clean old backup folders (keep .git and archives)
-    for item in repo_path.iterdir():
-        if item.name.startswith(".git"):
-            continue
-        if item.name.startswith("backup-") and ".tar" in item.name:
-            continue
-        if item.is_dir():
-            shutil.rmtree(item)
-            logger.debug(f"Removed old folder: {item.name}")
+            repo.branches.local.create(branch, repo.head.peel(pygit2.Commit))
+            repo.checkout(branch_ref)
+
+    # Clean old backup folders (keep .git and archives). Manifest folders are
+    # kept so unchanged files are not rewritten; stale manifests are pruned
+    # after the dump. Name checks run before is_dir() so skipped entries
+    # never need a stat call.
+    old_dirs = []
+    with os.scandir(repo_path) as entries:
+        for entry in entries:
+            if entry.name.startswith(".git") or entry.name in MANIFEST_DIRS:
+                continue
+            if entry.name.startswith("backup-") and ".tar" in entry.name:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                old_dirs.append(entry.path)
+    with ThreadPoolExecutor(max_workers=RMTREE_WORKERS) as executor:
+        for dir_path in executor.map(_remove_tree, old_dirs):
+            logger.debug(f"Removed old folder: {os.path.basename(dir_path)}")
 
     return repo
 
 
+def _committer_signature(
+    repo: pygit2.Repository, author: pygit2.Signature
+) -> pygit2.Signature:
+    """Committer from GIT_COMMITTER_* env, then git config, then the author."""
+    name = os.environ.get("GIT_COMMITTER_NAME")
+    email = os.environ.get("GIT_COMMITTER_EMAIL")
+    if name or email:
+        return pygit2.Signature(name or author.name, email or author.email)
+    try:
+        return repo.default_signature
+    except KeyError:
+        return author
+
+
 def git_commit_and_push(
-    repo: Repo,
-    repo_path: Path,
+    repo: pygit2.Repository,
     branch: str,
     remote_url: str,
     commit_user: str,
     commit_email: str,
     push: bool,
 ):
-    """Commit changes and push to remote."""
-    if repo.is_dirty(untracked_files=True):
-        repo.git.add(all=True)
-        author = f"{commit_user} <{commit_email}>"
-        repo.git.commit(
-            message=f"Backup {datetime.now(timezone.utc).isoformat()}",
-            author=author,
-            no_verify=True,
+    """Commit changes in-process with libgit2 and push to remote."""
+    status = repo.status()
+    if status:
+        index = repo.index
+        # add_all() stages new and modified files; deletions are staged here
+        for file_path, flags in status.items():
+            if flags & pygit2.GIT_STATUS_WT_DELETED:
+                index.remove(file_path)
+        index.add_all()
+        index.write()
+        tree = index.write_tree()
+        author = pygit2.Signature(commit_user, commit_email)
+        committer = _committer_signature(repo, author)
+        parents = [] if repo.head_is_unborn else [repo.head.target]
+        repo.create_commit(
+            "HEAD",
+            author,
+            committer,
+            f"Backup {datetime.now(timezone.utc).isoformat()}",
+            tree,
+            parents,
         )
         logger.info(f"Committing changes to git (branch: {branch})")
         if push:
+            callbacks = GitCallbacks(remote_url)
             try:
-                repo.git.push(remote_url, branch, set_upstream=True)
-                logger.info("Pushing to origin")
-            except Exception as e:
+                remote = repo.remotes.create_anonymous(remote_url)
+                remote.push(
+                    [f"refs/heads/{branch}:refs/heads/{branch}"],
+                    callbacks=callbacks,
+                    proxy=True,
+                )
+            except (pygit2.GitError, GitError) as e:
                 raise GitError(f"Git push failed: {e}")
+            if callbacks.rejected:
+                raise GitError(f"Git push failed: {'; '.join(callbacks.rejected)}")
+            logger.info("Pushing to origin")
     else:
         logger.info("No changes to commit")
 
@@ -344,10 +1019,13 @@ def git_commit_and_push(
 @click.option("--archive-rotate-days", default=7, envvar="ARCHIVE_ROTATE_DAYS")
 @click.option(
     "--archive-type",
-    type=click.Choice(["gz", "bz2", "xz"]),
+    type=click.Choice(["gz", "bz2", "xz", "zst", "lz4"]),
     default="gz",
     envvar="ARCHIVE_TYPE",
 )
+@click.option(
+    "--save-workers", default=0, type=click.IntRange(min=0), envvar="SAVE_WORKERS"
+)
 @click.option("--cluster-name", default="unknown", envvar="CLUSTER_NAME")
 @click.option("--slack-url", default=None, envvar="SLACK_URL")
 @click.option("--slack-channel", default="#alerts", envvar="SLACK_CHANNEL")
@@ -371,6 +1049,7 @@ def cli(
     archive,
     archive_rotate_days,
     archive_type,
+    save_workers,
     cluster_name,
     slack_url,
     slack_channel,
@@ -399,6 +1078,7 @@ def cli(
             archive=archive,
             archive_rotate_days=archive_rotate_days,
             archive_type=archive_type,
+            save_workers=save_workers,
             start_time=start_time,
         )
 
@@ -461,6 +1141,7 @@ def _run_backup(
     archive,
     archive_rotate_days,
     archive_type,
+    save_workers,
     start_time,
 ):
     mode_map = {
@@ -487,6 +1168,7 @@ def _run_backup(
         shutil.rmtree(dest)
 
     dest.mkdir(parents=True, exist_ok=True)
+    manifest_cache = ManifestCache(dest)
 
     # Load kubeconfig
     try:
@@ -503,8 +1185,9 @@ def _run_backup(
         ns_list = [n.strip() for n in namespaces.split(",") if n.strip()]
     else:
         try:
-            v1 = client.CoreV1Api()
-            ns_list = [ns.metadata.name for ns in v1.list_namespace().items]
+            ns_list = [
+                ns["metadata"]["name"] for ns in list_paged("/api/v1/namespaces")
+            ]
         except ApiException as e:
             logger.error(f"Failed to list namespaces: {e}")
             sys.exit(1)
@@ -514,66 +1197,104 @@ def _run_backup(
         logger.warning(
             "Manual resource lists not supported in auto-discovery mode. Ignoring."
         )
-    ns_resources, cls_resources = discover_resources()
-
-    # === Dump namespaced ===
-    if mode in ("all", "ns"):
-        logger.info("Dumping namespaced resources")
-        for ns in ns_list:
-            for group, version, res_name, _, kind in ns_resources:
-                try:
-                    if group == "":
-                        path = f"/api/{version}/namespaces/{ns}/{res_name}"
-                        api_version = version
-                    else:
-                        path = f"/apis/{group}/{version}/namespaces/{ns}/{res_name}"
-                        api_version = f"{group}/{version}"
-                    data = call_k8s_api(path)
-                    for item in data.get("items", []):
-                        # Add apiVersion and kind (not included in list items)
-                        item["apiVersion"] = api_version
-                        item["kind"] = kind
-                        cleaned = clean_resource(item, detailed=detailed)
-                        save_object(cleaned, dest, res_name, namespace=ns)
+    ns_resources, cls_resources = discover_resources_cached()
+    # Precompute request paths once per resource
+    ns_resources = [
+        (res_name, kind, *resource_paths(group, version, res_name))
+        for group, version, res_name, _, kind in ns_resources
+    ]
+    cls_resources = [
+        (res_name, kind, *resource_paths(group, version, res_name))
+        for group, version, res_name, _, kind in cls_resources
+    ]
+
+    # API responses are fetched by threads; YAML is emitted in-process or,
+    # with --save-workers, by worker processes
+    with ManifestWriter(dest, manifest_cache, workers=save_workers) as writer:
+        # === Dump namespaced ===
+        if mode in ("all", "ns"):
+            logger.info("Dumping namespaced resources")
+            # Cluster-wide lists also return unselected namespaces; filter them
+            wanted_ns = set(ns_list)
+            jobs = []
+            for res_name, kind, api_version, list_path, ns_tmpl in ns_resources:
+                failed_ns: Dict[str, Exception] = {}
+                pages = list_namespaced(list_path, ns_tmpl, ns_list, failed_ns)
+                jobs.append(((res_name, kind, api_version, failed_ns, set()), pages))
+
+            # Hand items to the writer page by page as they arrive
+            for key, page, error in stream_pages(jobs):
+                res_name, kind, api_version, failed_ns, dumped_ns = key
+                if page is not None:
+                    try:
+                        for item in page:
+                            ns = item.get("metadata", {}).get("namespace")
+                            if ns not in wanted_ns:
+                                continue
+                            # Add apiVersion and kind (not included in list items)
+                            item["apiVersion"] = api_version
+                            item["kind"] = kind
+                            cleaned = clean_resource(item, detailed=detailed)
+                            writer.submit(cleaned, res_name, ns)
+                            dumped_ns.add(ns)
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        logger.debug(f"Failed to dump {res_name}: {e}")
+                    continue
+
+                # Resource finished; log on the main thread so output never interleaves
+                for ns, err in failed_ns.items():
+                    log_namespace_error(res_name, ns, err)
+                for ns in sorted(dumped_ns):
                     logger.info(f"Dumping {res_name} from namespace={ns}")
-                except ApiException as e:
-                    if e.status == 403:
-                        logger.warning(f"Access denied to {res_name} in namespace={ns}")
-                    elif e.status == 404:
-                        continue
-                    else:
-                        logger.debug(f"API error for {res_name}: {e}")
-                except Exception as e:
-                    logger.debug(f"Failed to dump {res_name} in {ns}: {e}")
-
-    # === Dump cluster ===
-    if mode in ("all", "cls"):
-        logger.info("Dumping cluster-wide resources")
-        for group, version, res_name, _, kind in cls_resources:
-            try:
-                if group == "":
-                    path = f"/api/{version}/{res_name}"
-                    api_version = version
-                else:
-                    path = f"/apis/{group}/{version}/{res_name}"
-                    api_version = f"{group}/{version}"
-                data = call_k8s_api(path)
-                for item in data.get("items", []):
-                    # Add apiVersion and kind (not included in list items)
-                    item["apiVersion"] = api_version
-                    item["kind"] = kind
-                    cleaned = clean_resource(item, detailed=detailed)
-                    save_object(cleaned, dest, res_name, namespace=None)
-                logger.info(f"Dumping cluster-wide resource: {res_name}")
-            except ApiException as e:
-                if e.status == 403:
-                    logger.warning(f"Access denied to {res_name}")
-                elif e.status == 404:
+                if isinstance(error, ApiException):
+                    if error.status != 404:
+                        logger.debug(f"API error for {res_name}: {error}")
+                elif error is not None:
+                    logger.debug(f"Failed to dump {res_name}: {error}")
+
+        # === Dump cluster ===
+        if mode in ("all", "cls"):
+            logger.info("Dumping cluster-wide resources")
+            jobs = [
+                ((res_name, kind, api_version), list_pages(path))
+                for res_name, kind, api_version, path, _ in cls_resources
+            ]
+
+            # Hand items to the writer page by page as they arrive
+            for (res_name, kind, api_version), page, error in stream_pages(jobs):
+                if page is not None:
+                    try:
+                        for item in page:
+                            # Add apiVersion and kind (not included in list items)
+                            item["apiVersion"] = api_version
+                            item["kind"] = kind
+                            cleaned = clean_resource(item, detailed=detailed)
+                            writer.submit(cleaned, res_name, None)
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        logger.debug(f"Failed to dump {res_name}: {e}")
                     continue
+
+                # Resource finished; log on the main thread so output never interleaves
+                if error is None:
+                    logger.info(f"Dumping cluster-wide resource: {res_name}")
+                elif isinstance(error, ApiException):
+                    if error.status == 403:
+                        logger.warning(f"Access denied to {res_name}")
+                    elif error.status != 404:
+                        logger.debug(f"API error for {res_name}: {error}")
                 else:
-                    logger.debug(f"API error for {res_name}: {e}")
-            except Exception as e:
-                logger.debug(f"Failed to dump {res_name}: {e}")
+                    logger.debug(f"Failed to dump {res_name}: {error}")
+
+    manifest_cache.save()
+
+    # Git mode keeps the previous tree, so drop manifests of deleted objects
+    if git_repo is not None:
+        removed = prune_manifests(dest, manifest_cache.current)
+        logger.debug(f"Pruned {removed} stale manifests")
 
     # === Archive in root ===
     if archive:
@@ -581,26 +1302,7 @@ def _run_backup(
         archive_name = f"backup-{now}.tar.{archive_type}"
         archive_path = dest / archive_name
 
-        tar_path = dest / f"backup-{now}.tar"
-        with tarfile.open(tar_path, "w") as tar:
-            for item in dest.iterdir():
-                if item.name.startswith("backup-") and (
-                    ".tar" in item.name or item.name.endswith(f".{archive_type}")
-                ):
-                    continue
-                tar.add(item, arcname=item.name)
-
-        if archive_type == "gz":
-            with open(tar_path, "rb") as f_in, gzip.open(archive_path, "wb") as f_out:
-                shutil.copyfileobj(f_in, f_out)
-        elif archive_type == "bz2":
-            with open(tar_path, "rb") as f_in, bz2.open(archive_path, "wb") as f_out:
-                shutil.copyfileobj(f_in, f_out)
-        elif archive_type == "xz":
-            with open(tar_path, "rb") as f_in, lzma.open(archive_path, "wb") as f_out:
-                shutil.copyfileobj(f_in, f_out)
-
-        tar_path.unlink()
+        write_archive(dest, archive_path, archive_type)
         logger.info(f"Archiving to {archive_path}")
 
         cutoff = datetime.now() - timedelta(days=archive_rotate_days)
@@ -610,10 +1312,9 @@ def _run_backup(
                 logger.info(f"Rotated old archive: {arch.name}")
 
     # === Git commit and push ===
-    if git_commit and git_repo and git_remote_url:
+    if git_commit and git_repo is not None and git_remote_url:
         git_commit_and_push(
             repo=git_repo,
-            repo_path=dest,
             branch=git_branch,
             remote_url=git_remote_url,
             commit_user=git_commit_user,